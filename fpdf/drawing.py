@@ -835,7 +835,8 @@ class Transform(NamedTuple):
         Returns:
             A Transform representing the composed transform.
         """
-        return self @ Transform.translation(x, y)
+        # equivalent to self @ Transform.translation(x, y), without the full product
+        return self.__class__(self.a, self.b, self.c, self.d, self.e + x, self.f + y)
 
     def scale(self, x, y=None):
         """
@@ -855,7 +856,12 @@ class Transform(NamedTuple):
         Returns:
             A Transform representing the composed transform.
         """
-        return self @ Transform.scaling(x, y)
+        # equivalent to self @ Transform.scaling(x, y), without the full product
+        if y is None:
+            y = x
+        return self.__class__(
+            self.a * x, self.b * y, self.c * x, self.d * y, self.e * x, self.f * y
+        )
 
     def rotate(self, theta):
         """
@@ -3221,6 +3227,14 @@ class PaintedPath:
     primitive path elements and `GraphicsContext`.
     """
 
+    __slots__ = (
+        "_root_graphics_context",
+        "_graphics_context",
+        "_closed",
+        "_close_context",
+        "_starter_move",
+    )
+
     def __init__(self, x=0, y=0):
         self._root_graphics_context = GraphicsContext()
         self._graphics_context = self._root_graphics_context
@@ -3807,6 +3821,8 @@ class ClippingPath(PaintedPath):
     # In general, the expectation is that painted clipping paths are likely to be very
     # uncommon, so it's an edge case that isn't worth worrying too much about.
 
+    __slots__ = ()
+
     def __init__(self, x=0, y=0):
         super().__init__(x=x, y=y)
         self.paint_rule = PathPaintRule.DONT_PAINT
@@ -3882,6 +3898,8 @@ class ClippingPath(PaintedPath):
 
 
 class GraphicsContext:
+    __slots__ = ("style", "path_items", "_transform", "_clipping_path")
+
     def __init__(self):
         self.style = GraphicsStyle()
         self.path_items = []
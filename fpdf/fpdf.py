@@ -3417,7 +3417,7 @@ class FPDF(GraphicsStateMixin):
         _, _, path = svg.transform_to_rect_viewport(
             scale=1, width=w, height=h, ignore_svg_top_attrs=True
         )
-        path.transform = path.transform @ drawing.Transform.translation(x, y)
+        path.transform = path.transform.translate(x, y)
 
         old_x, old_y = self.x, self.y
         try:
@@ -1,7 +1,8 @@
 import math
 import re
 import warnings
-from typing import NamedTuple
+from array import array
+from functools import lru_cache
 
 try:
     from svg.path import (
@@ -16,9 +17,12 @@ try:
 except ImportError:
     warnings.warn(
         "svg.path could not be imported - fpdf2 will not be able to render SVG images"
+        " with malformed path data"
     )
     parse_path = None
 
+# Both parsers rely on the C-accelerated expat-based ElementTree, parsing is only a
+# small fraction of the conversion time, so there is no need for another XML backend.
 try:
     from defusedxml.ElementTree import fromstring as parse_xml_str
 except ImportError:
@@ -55,17 +59,28 @@ _HANDY_NAMESPACES = {
     "xlink": "http://www.w3.org/1999/xlink",
 }
 
-NUMBER_SPLIT = re.compile(r"(?:\s+,\s+|\s+,|,\s+|\s+|,)")
 TRANSFORM_GETTER = re.compile(
     r"(matrix|rotate|scale|scaleX|scaleY|skew|skewX|skewY|translate|translateX|translateY)"
     r"\(((?:\s*(?:[-+]?[\d\.]+,?)+\s*)+)\)"
 )
 
 
+# numbers in SVG lists don't need a separator before a sign or a second decimal point,
+# e.g. "10-10" is 10 followed by -10 and "20.5.5" is 20.5 followed by .5
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def _split_numbers(numbers):
+    """Split a list of numbers separated by commas and/or whitespace."""
+    return numbers.replace(",", " ").split()
+
+
 @force_nodocument
 class Percent(float):
     """class to represent percentage values"""
 
+    __slots__ = ()
+
 
 unit_splitter = re.compile(r"\s*(?P<value>[-+]?[\d\.]+)\s*(?P<unit>%|[a-zA-Z]*)")
 
@@ -108,6 +123,22 @@ angle_units = {
     "rad": 1,  # pdf canonical unit
     "turn": math.tau,
 }
+_DEG = angle_units["deg"]
+
+
+def _split_length_unit(length_str):
+    # nearly all length units are 2 letters long, try these before the regex
+    unit = length_str[-2:]
+    if unit.isalpha():
+        try:
+            return float(length_str[:-2]), unit
+        except ValueError:
+            pass
+
+    match = unit_splitter.match(length_str)
+    if match is None:
+        raise ValueError(f"{length_str} is not a valid length")
+    return match.groups()
 
 
 # in CSS the default length unit is px, but as far as I can tell, for SVG interpreting
@@ -116,14 +147,31 @@ angle_units = {
 # because this results in the output PDF having the correct physical dimensions (i.e. a
 # feature with a 1cm size in SVG will actually end up being 1cm in size in the PDF).
 @force_nodocument
+@lru_cache(maxsize=1024)
 def resolve_length(length_str, default_unit="pt"):
     """Convert a length unit to our canonical length unit, pt."""
-    value, unit = unit_splitter.match(length_str).groups()
-    if not unit:
-        unit = default_unit
+    # float() accepts digit grouping underscores, SVG numbers don't
+    if "_" in length_str:
+        raise ValueError(f"{length_str} is not a valid length")
+
+    try:
+        # unitless numbers are by far the most common, so they skip the regex
+        value, unit = float(length_str), default_unit
+    except ValueError:
+        value, unit = _split_length_unit(length_str)
+        value = float(value)
+        if not unit:
+            unit = default_unit
+
+    # float() also accepts "nan", "inf" & "infinity"
+    if not math.isfinite(value):
+        raise ValueError(f"{length_str} is not a valid length")
+
+    if unit == "pt":
+        return value
 
     try:
-        return float(value) * absolute_length_units[unit]
+        return value * absolute_length_units[unit]
     except KeyError:
         if unit in relative_length_units:
             raise ValueError(
@@ -134,14 +182,34 @@ def resolve_length(length_str, default_unit="pt"):
 
 
 @force_nodocument
+@lru_cache(maxsize=1024)
 def resolve_angle(angle_str, default_unit="deg"):
     """Convert an angle value to our canonical angle unit, radians"""
-    value, unit = unit_splitter.match(angle_str).groups()
-    if not unit:
-        unit = default_unit
+    # float() accepts digit grouping underscores, SVG numbers don't
+    if "_" in angle_str:
+        raise ValueError(f"{angle_str} is not a valid angle")
+
+    try:
+        # transform angles are nearly always bare numbers in degrees
+        value, unit = float(angle_str), default_unit
+    except ValueError:
+        match = unit_splitter.match(angle_str)
+        if match is None:
+            raise ValueError(f"{angle_str} is not a valid angle") from None
+        value, unit = match.groups()
+        value = float(value)
+        if not unit:
+            unit = default_unit
+
+    # float() also accepts "nan", "inf" & "infinity"
+    if not math.isfinite(value):
+        raise ValueError(f"{angle_str} is not a valid angle")
+
+    if unit == "deg":
+        return value * _DEG
 
     try:
-        return float(value) * angle_units[unit]
+        return value * angle_units[unit]
     except KeyError:
         raise ValueError(f"angle {angle_str} has unknown unit {unit}") from None
 
@@ -172,9 +240,30 @@ def xmlns_lookup(space, *names):
 shape_tags = xmlns_lookup(
     "svg", "rect", "circle", "ellipse", "line", "polyline", "polygon"
 )
+_SVG_ROOT_TAGS = frozenset(xmlns_lookup("svg", "svg"))
+_SVG_DEFS_TAGS = frozenset(xmlns_lookup("svg", "defs"))
+_SVG_G_TAGS = frozenset(xmlns_lookup("svg", "g"))
+_SVG_PATH_TAGS = frozenset(xmlns_lookup("svg", "path"))
+_SVG_USE_TAGS = frozenset(xmlns_lookup("svg", "use"))
+_XLINK_HREF_KEYS = tuple(xmlns_lookup("xlink", "href"))
+
+# marks nested <g> in _GROUP_CHILD_BUILDERS, these are walked by SVGObject.build_group
+# itself rather than converted by a method call
+_NESTED_GROUP = object()
+
+# The SVGObject method converting each kind of group child, keyed by tag. Any other tag
+# (e.g. <title>, <metadata> or editor specific elements) is ignored.
+_GROUP_CHILD_BUILDERS = {
+    **dict.fromkeys(_SVG_DEFS_TAGS, "handle_defs"),
+    **dict.fromkeys(_SVG_G_TAGS, _NESTED_GROUP),
+    **dict.fromkeys(_SVG_PATH_TAGS, "build_path"),
+    **dict.fromkeys(shape_tags, "build_shape"),
+    **dict.fromkeys(_SVG_USE_TAGS, "build_xref"),
+}
 
 
 @force_nodocument
+@lru_cache(maxsize=1024)
 def svgcolor(colorstr):
     try:
         colorstr = html.COLOR_DICT[colorstr]
@@ -187,6 +276,20 @@ def svgcolor(colorstr):
     raise ValueError(f"unsupported color specification {colorstr}")
 
 
+def clear_svg_caches():
+    """
+    Empty the caches of converted SVG lengths, angles, colors, styles and transforms.
+
+    These values are memoized across all `SVGObject` conversions, which may be
+    undesirable in long-running processes converting many unrelated SVG files.
+    """
+    resolve_length.cache_clear()
+    resolve_angle.cache_clear()
+    svgcolor.cache_clear()
+    convert_style_attrs.cache_clear()
+    convert_transforms.cache_clear()
+
+
 @force_nodocument
 def convert_stroke_width(incoming):
     val = float(incoming)
@@ -220,10 +323,13 @@ def clamp_float(min_val, max_val):
     return converter
 
 
+_INHERIT = GraphicsStyle.INHERIT
+
+
 @force_nodocument
 def inheritable(value, converter=lambda value: value):
     if value == "inherit":
-        return GraphicsStyle.INHERIT
+        return _INHERIT
 
     return converter(value)
 
@@ -258,9 +364,7 @@ svg_attr_map = {
     # https://www.w3.org/TR/SVG11/painting.html#StrokeDasharrayProperty
     "stroke-dasharray": lambda dasharray: (
         "stroke_dash_pattern",
-        optional(
-            dasharray, lambda da: [float(item) for item in NUMBER_SPLIT.split(da)]
-        ),
+        optional(dasharray, lambda da: list(map(float, _split_numbers(da)))),
     ),
     # stroke-dashoffset may be a percentage, which we don't support currently
     # https://www.w3.org/TR/SVG11/painting.html#StrokeDashoffsetProperty
@@ -283,59 +387,85 @@ svg_attr_map = {
         inheritable(stropstr, clamp_float(0.0, 1.0)),
     ),
 }
+# every attribute apply_styles looks at
+_STYLE_KEYS = frozenset(svg_attr_map) | {"style", "opacity", "transform"}
 
 
 @force_nodocument
 def parse_style(svg_element):
     """Parse `style="..."` making it's key-value pairs element's attributes"""
-    try:
-        style = svg_element.attrib["style"]
-    except KeyError:
-        pass
-    else:
+    style = svg_element.attrib.get("style")
+    if style is not None:
         for element in style.split(";"):
-            if not element:
-                continue
+            attr, sep, value = element.partition(":")
+            if sep and attr and value:
+                svg_element.attrib[attr.strip()] = value.strip()
 
-            pair = element.split(":")
-            if len(pair) == 2 and pair[0] and pair[1]:
-                attr, value = pair
 
-                svg_element.attrib[attr.strip()] = value.strip()
+# sibling elements very often share the exact same styling attributes
+@force_nodocument
+@lru_cache(maxsize=1024)
+def convert_style_attrs(style_attrs):
+    """Convert (svg attribute, value) pairs to (GraphicsStyle attribute, value) pairs."""
+    return tuple(
+        svg_attr_map[svg_attr](raw_value) for svg_attr, raw_value in style_attrs
+    )
 
 
 @force_nodocument
 def apply_styles(stylable, svg_element):
     """Apply the known styles from `svg_element` to the pdf path/group `stylable`."""
-    parse_style(svg_element)
-
     stylable.style.auto_close = False
 
-    for svg_attr, converter in svg_attr_map.items():
-        try:
-            attr, value = converter(svg_element.attrib[svg_attr])
-        except KeyError:
-            pass
-        else:
-            setattr(stylable.style, attr, value)
+    attrib = svg_element.attrib
+    if _STYLE_KEYS.isdisjoint(attrib):
+        return
+
+    parse_style(svg_element)
+
+    style_attrs = tuple(
+        (svg_attr, attrib[svg_attr]) for svg_attr in svg_attr_map if svg_attr in attrib
+    )
+    for attr, value in convert_style_attrs(style_attrs):
+        setattr(stylable.style, attr, value)
 
     # handle this separately for now
-    try:
-        opacity = float(svg_element.attrib["opacity"])
-    except KeyError:
-        pass
-    else:
+    opacity = attrib.get("opacity")
+    if opacity is not None:
+        opacity = float(opacity)
         stylable.style.fill_opacity = opacity
         stylable.style.stroke_opacity = opacity
 
-    try:
-        tfstr = svg_element.attrib["transform"]
-    except KeyError:
-        pass
-    else:
+    tfstr = attrib.get("transform")
+    if tfstr is not None:
         stylable.transform = convert_transforms(tfstr)
 
 
+def _rect_radius(value):
+    """Convert a <rect> rx/ry attribute, returning None if it is unset or "auto"."""
+    if value is None or value == "auto":
+        return None
+    if value == "none":
+        return 0
+    return float(value)
+
+
+def _polyline_converter(pdf_path, points):
+    # points is a plain list of coordinate pairs, no need for the full path parser. As
+    # per the SVG spec, an odd trailing coordinate is ignored.
+    coords = map(float, _NUMBER.findall(points))
+    pairs = zip(coords, coords)
+    start = next(pairs, None)
+    if start is None:
+        return False
+
+    pdf_path.move_to(*start)
+    for x, y in pairs:
+        pdf_path.line_to(x, y)
+
+    return True
+
+
 @force_nodocument
 class ShapeBuilder:
     """A namespace within which methods for converting basic shapes can be looked up."""
@@ -352,27 +482,19 @@ class ShapeBuilder:
     def rect(cls, tag):
         """Convert an SVG <rect> into a PDF path."""
         # svg rect is wound clockwise
-        x = float(tag.attrib.get("x", 0))
-        y = float(tag.attrib.get("y", 0))
-        width = float(tag.attrib.get("width", 0))
-        height = float(tag.attrib.get("height", 0))
-        rx = tag.attrib.get("rx", "auto")
-        ry = tag.attrib.get("ry", "auto")
-
-        if rx == "none":
-            rx = 0
-        if ry == "none":
-            ry = 0
-
-        if rx == ry == "auto":
-            rx = ry = 0
-        elif rx == "auto":
-            rx = ry = float(ry)
-        elif ry == "auto":
-            ry = rx = float(rx)
-        else:
-            rx = float(rx)
-            ry = float(ry)
+        attrib = tag.attrib
+        x = float(attrib.get("x", 0))
+        y = float(attrib.get("y", 0))
+        width = float(attrib.get("width", 0))
+        height = float(attrib.get("height", 0))
+        rx = _rect_radius(attrib.get("rx"))
+        ry = _rect_radius(attrib.get("ry"))
+
+        # an "auto" radius takes the value of the other one
+        if rx is None:
+            rx = 0 if ry is None else ry
+        if ry is None:
+            ry = rx
 
         if (width < 0) or (height < 0) or (rx < 0) or (ry < 0):
             raise ValueError(f"bad rect {tag}")
@@ -449,8 +571,7 @@ class ShapeBuilder:
 
         path = cls.new_path(tag)
 
-        points = "M" + points
-        svg_path_converter(path, points)
+        _polyline_converter(path, points)
 
         return path
 
@@ -461,121 +582,230 @@ class ShapeBuilder:
 
         path = cls.new_path(tag)
 
-        points = "M" + points + "Z"
-        svg_path_converter(path, points)
+        if _polyline_converter(path, points):
+            path.close()
 
         return path
 
 
+# The following handlers return the (a, b, c, d, e, f) parameters of the transform
+# matrix described by a transform function, see `fpdf.drawing.Transform`.
+
+
+def _matrix_transform(args):
+    a, b, c, d, e, f = map(float, _split_numbers(args))
+    return a, b, c, d, e, f
+
+
+def _rotate_transform(args):
+    theta, *about = _split_numbers(args)
+    theta = resolve_angle(theta)
+    cos, sin = math.cos(theta), math.sin(theta)
+    rotation = (cos, sin, -sin, cos, 0, 0)
+    if about:
+        # this is an SVG 1.1 feature. SVG 2 uses the transform-origin property.
+        # see: https://www.w3.org/TR/SVG11/coords.html#TransformAttribute
+        if len(about) == 2:
+            cx, cy = float(about[0]), float(about[1])
+            # translate(cx, cy) rotate(theta) translate(-cx, -cy), multiplied out
+            rotation = (
+                cos,
+                sin,
+                -sin,
+                cos,
+                -cx * cos + cy * sin + cx,
+                -cx * sin - cy * cos + cy,
+            )
+        else:
+            raise ValueError(f"rotation transform rotate({args}) is malformed")
+
+    return rotation
+
+
+def _scale_transform(args):
+    # if sy is not provided, it takes a value equal to sx
+    args = _split_numbers(args)
+    if len(args) == 2:
+        sx = float(args[0])
+        sy = float(args[1])
+    elif len(args) == 1:
+        sx = sy = float(args[0])
+    else:
+        raise ValueError(f"bad scale transform scale({' '.join(args)})")
+
+    return sx, 0, 0, sy, 0, 0
+
+
+def _skew_transform(args):
+    # SVG 2, not the same as skewX@skewY
+    # if sy is not provided, it takes a value equal to 0
+    args = _split_numbers(args)
+    if len(args) == 2:
+        sx = resolve_angle(args[0])
+        sy = resolve_angle(args[1])
+    elif len(args) == 1:
+        sx = resolve_angle(args[0])
+        sy = 0
+    else:
+        raise ValueError(f"bad skew transform skew({' '.join(args)})")
+
+    return 1, math.tan(sy), math.tan(sx), 1, 0, 0
+
+
+def _translate_transform(args):
+    # if y is not provided, it takes a value equal to 0
+    args = _split_numbers(args)
+    if len(args) == 2:
+        x = resolve_length(args[0])
+        y = resolve_length(args[1])
+    elif len(args) == 1:
+        x = resolve_length(args[0])
+        y = 0
+    else:
+        raise ValueError(f"bad translation transform translate({' '.join(args)})")
+
+    return 1, 0, 0, 1, x, y
+
+
+_TRANSFORM_HANDLERS = {
+    "matrix": _matrix_transform,
+    "rotate": _rotate_transform,
+    "scale": _scale_transform,
+    "scaleX": lambda args: (float(args), 0, 0, 1, 0, 0),  # SVG 2
+    "scaleY": lambda args: (1, 0, 0, float(args), 0, 0),  # SVG 2
+    "skew": _skew_transform,  # SVG 2
+    "skewX": lambda args: (1, 0, math.tan(resolve_angle(args)), 1, 0, 0),
+    "skewY": lambda args: (1, math.tan(resolve_angle(args)), 0, 1, 0, 0),
+    "translate": _translate_transform,
+    "translateX": lambda args: (1, 0, 0, 1, resolve_length(args), 0),  # SVG 2
+    "translateY": lambda args: (1, 0, 0, 1, 0, resolve_length(args)),  # SVG 2
+}
+
+# transforms are immutable, so a single identity can be shared by everything
+_IDENTITY = Transform.identity()
+
+
 @force_nodocument
+@lru_cache(maxsize=512)
 def convert_transforms(tfstr):
     """Convert SVG/CSS transform functions into PDF transforms."""
+    if "(" not in tfstr:
+        # e.g. transform="" or transform="none"
+        return _IDENTITY
 
     # SVG 2 uses CSS transforms. SVG 1.1 transforms are slightly different. I'm really
     # not sure if it is worth it to try to support SVG 2 because it is significantly
     # more entangled with The HTML Disaster than SVG 1.1, which makes it astronomically
     # harder to support.
     # https://drafts.csswg.org/css-transforms/#two-d-transform-functions
-    parsed = TRANSFORM_GETTER.findall(tfstr)
-
-    transform = Transform.identity()
-    for tf_type, args in parsed:
-        if tf_type == "matrix":
-            a, b, c, d, e, f = tuple(float(n) for n in NUMBER_SPLIT.split(args))
-            transform = Transform(a, b, c, d, e, f) @ transform
-
-        elif tf_type == "rotate":
-            theta, *about = NUMBER_SPLIT.split(args)
-            theta = resolve_angle(theta)
-            rotation = Transform.rotation(theta=theta)
-            if about:
-                # this is an SVG 1.1 feature. SVG 2 uses the transform-origin property.
-                # see: https://www.w3.org/TR/SVG11/coords.html#TransformAttribute
-                if len(about) == 2:
-                    rotation = rotation.about(float(about[0]), float(about[1]))
-                else:
-                    raise ValueError(
-                        f"rotation transform {tf_type}({args}) is malformed"
-                    )
+    # each transform function is left-multiplied into the accumulated matrix, i.e.
+    # `transform = Transform(...) @ transform`, but without building any intermediate
+    # Transform instances.
+    a, b, c, d, e, f = 1, 0, 0, 1, 0, 0
+    for tf_type, args in TRANSFORM_GETTER.findall(tfstr):
+        ta, tb, tc, td, te, tf = _TRANSFORM_HANDLERS[tf_type](args)
+        a, b, c, d, e, f = (
+            ta * a + tb * c,
+            ta * b + tb * d,
+            tc * a + td * c,
+            tc * b + td * d,
+            te * a + tf * c + e,
+            te * b + tf * d + f,
+        )
 
-            transform = rotation @ transform
+    return Transform(a, b, c, d, e, f)
 
-        elif tf_type == "scale":
-            # if sy is not provided, it takes a value equal to sx
-            args = NUMBER_SPLIT.split(args)
-            if len(args) == 2:
-                sx = float(args[0])
-                sy = float(args[1])
-            elif len(args) == 1:
-                sx = sy = float(args[0])
-            else:
-                raise ValueError(f"bad scale transform {tfstr}")
 
-            transform = Transform.scaling(x=sx, y=sy) @ transform
+class _SVGPathElement:
+    """
+    Base class of the SVG-specific path elements.
 
-        elif tf_type == "scaleX":  # SVG 2
-            transform = Transform.scaling(x=float(args), y=1) @ transform
+    Unlike the `fpdf.drawing` path elements, these store their coordinates as bare
+    floats and only build the `Point`s they need when being rendered. Instances are
+    treated as immutable. Subclasses list their coordinates in `_fields`.
+    """
 
-        elif tf_type == "scaleY":  # SVG 2
-            transform = Transform.scaling(x=1, y=float(args)) @ transform
+    __slots__ = ()
+    _fields = ()
 
-        elif tf_type == "skew":  # SVG 2, not the same as skewX@skewY
-            # if sy is not provided, it takes a value equal to 0
-            args = NUMBER_SPLIT.split(args)
-            if len(args) == 2:
-                sx = resolve_angle(args[0])
-                sy = resolve_angle(args[1])
-            elif len(args) == 1:
-                sx = resolve_angle(args[0])
-                sy = 0
-            else:
-                raise ValueError(f"bad skew transform {tfstr}")
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
 
-            transform = Transform.shearing(x=math.tan(sx), y=math.tan(sy)) @ transform
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self._fields)
 
-        elif tf_type == "skewX":
-            transform = (
-                Transform.shearing(x=math.tan(resolve_angle(args)), y=0) @ transform
-            )
+    def __hash__(self):
+        return hash((self.__class__, *(getattr(self, attr) for attr in self._fields)))
 
-        elif tf_type == "skewY":
-            transform = (
-                Transform.shearing(x=0, y=math.tan(resolve_angle(args))) @ transform
-            )
+    def __repr__(self):
+        fields = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr in self._fields)
+        return f"{self.__class__.__name__}({fields})"
 
-        elif tf_type == "translate":
-            # if y is not provided, it takes a value equal to 0
-            args = NUMBER_SPLIT.split(args)
-            if len(args) == 2:
-                x = resolve_length(args[0])
-                y = resolve_length(args[1])
-            elif len(args) == 1:
-                x = resolve_length(args[0])
-                y = 0
-            else:
-                raise ValueError(f"bad translation transform {tfstr}")
+    def __copy__(self):
+        return self
 
-            transform = Transform.translation(x=x, y=y) @ transform
+    def __deepcopy__(self, memo):
+        return self
 
-        elif tf_type == "translateX":  # SVG 2
-            transform = Transform.translation(x=resolve_length(args), y=0) @ transform
+    def render_debug(
+        self, path_gsds, style, last_item, initial_point, debug_stream, pfx
+    ):
+        # pylint: disable=unused-argument,no-member
+        rendered, resolved, initial_point = self.render(
+            path_gsds, style, last_item, initial_point
+        )
+        debug_stream.write(f"{self} resolved to {resolved}\n")
 
-        elif tf_type == "translateY":  # SVG 2
-            transform = Transform.translation(x=0, y=resolve_length(args)) @ transform
+        return rendered, resolved, initial_point
 
-    return transform
 
+class _SVGSmoothCubicElement(_SVGPathElement):
+    """Base class of the chained cubic Bézier curve path elements."""
 
-@force_nodocument
-class SVGSmoothCubicCurve(NamedTuple):
-    """SVG chained cubic Bézier curve path element."""
+    __slots__ = _fields = ("c2x", "c2y", "ex", "ey")
+
+    def __init__(self, c2x, c2y, ex, ey):
+        self.c2x = c2x
+        self.c2y = c2y
+        self.ex = ex
+        self.ey = ey
 
-    c2: Point
-    end: Point
+    @property
+    def c2(self):
+        return Point(self.c2x, self.c2y)
+
+    @property
+    def end(self):
+        return Point(self.ex, self.ey)
 
     @classmethod
     def from_path_points(cls, path, c2x, c2y, ex, ey):
-        return path.add_path_element(cls(c2=Point(x=c2x, y=c2y), end=Point(x=ex, y=ey)))
+        return path.add_path_element(cls(c2x, c2y, ex, ey), _copy=False)
+
+
+class _SVGSmoothQuadraticElement(_SVGPathElement):
+    """Base class of the chained quadratic Bézier curve path elements."""
+
+    __slots__ = _fields = ("ex", "ey")
+
+    def __init__(self, ex, ey):
+        self.ex = ex
+        self.ey = ey
+
+    @property
+    def end(self):
+        return Point(self.ex, self.ey)
+
+    @classmethod
+    def from_path_points(cls, path, ex, ey):
+        return path.add_path_element(cls(ex, ey), _copy=False)
+
+
+@force_nodocument
+class SVGSmoothCubicCurve(_SVGSmoothCubicElement):
+    """SVG chained cubic Bézier curve path element."""
+
+    __slots__ = ()
 
     def render(self, path_gsds, style, last_item, initial_point):
         # technically, it would also be possible to chain on from a quadratic Bézier,
@@ -593,28 +823,12 @@ class SVGSmoothCubicCurve(NamedTuple):
             path_gsds, style, last_item, initial_point
         )
 
-    def render_debug(
-        self, path_gsds, style, last_item, initial_point, debug_stream, pfx
-    ):
-        # pylint: disable=unused-argument
-        rendered, resolved, initial_point = self.render(
-            path_gsds, style, last_item, initial_point
-        )
-        debug_stream.write(f"{self} resolved to {resolved}\n")
-
-        return rendered, resolved, initial_point
-
 
 @force_nodocument
-class SVGRelativeSmoothCubicCurve(NamedTuple):
+class SVGRelativeSmoothCubicCurve(_SVGSmoothCubicElement):
     """SVG chained relative cubic Bézier curve path element."""
 
-    c2: Point
-    end: Point
-
-    @classmethod
-    def from_path_points(cls, path, c2x, c2y, ex, ey):
-        return path.add_path_element(cls(c2=Point(x=c2x, y=c2y), end=Point(x=ex, y=ey)))
+    __slots__ = ()
 
     def render(self, path_gsds, style, last_item, initial_point):
         last_point = last_item.end_point
@@ -624,34 +838,19 @@ class SVGRelativeSmoothCubicCurve(NamedTuple):
         else:
             c1 = last_point
 
-        c2 = last_point + self.c2
-        end = last_point + self.end
+        c2 = Point(last_point.x + self.c2x, last_point.y + self.c2y)
+        end = Point(last_point.x + self.ex, last_point.y + self.ey)
 
         return BezierCurve(c1, c2, end).render(
             path_gsds, style, last_item, initial_point
         )
 
-    def render_debug(
-        self, path_gsds, style, last_item, initial_point, debug_stream, pfx
-    ):
-        # pylint: disable=unused-argument
-        rendered, resolved, initial_point = self.render(
-            path_gsds, style, last_item, initial_point
-        )
-        debug_stream.write(f"{self} resolved to {resolved}\n")
-
-        return rendered, resolved, initial_point
-
 
 @force_nodocument
-class SVGSmoothQuadraticCurve(NamedTuple):
+class SVGSmoothQuadraticCurve(_SVGSmoothQuadraticElement):
     """SVG chained quadratic Bézier curve path element."""
 
-    end: Point
-
-    @classmethod
-    def from_path_points(cls, path, ex, ey):
-        return path.add_path_element(cls(end=Point(x=ex, y=ey)))
+    __slots__ = ()
 
     def render(self, path_gsds, style, last_item, initial_point):
         if isinstance(last_item, QuadraticBezierCurve):
@@ -663,27 +862,12 @@ class SVGSmoothQuadraticCurve(NamedTuple):
             path_gsds, style, last_item, initial_point
         )
 
-    def render_debug(
-        self, path_gsds, style, last_item, initial_point, debug_stream, pfx
-    ):
-        # pylint: disable=unused-argument
-        rendered, resolved, initial_point = self.render(
-            path_gsds, style, last_item, initial_point
-        )
-        debug_stream.write(f"{self} resolved to {resolved}\n")
-
-        return rendered, resolved, initial_point
-
 
 @force_nodocument
-class SVGRelativeSmoothQuadraticCurve(NamedTuple):
+class SVGRelativeSmoothQuadraticCurve(_SVGSmoothQuadraticElement):
     """SVG chained relative quadratic Bézier curve path element."""
 
-    end: Point
-
-    @classmethod
-    def from_path_points(cls, path, ex, ey):
-        return path.add_path_element(cls(end=Point(x=ex, y=ey)))
+    __slots__ = ()
 
     def render(self, path_gsds, style, last_item, initial_point):
         last_point = last_item.end_point
@@ -693,166 +877,325 @@ class SVGRelativeSmoothQuadraticCurve(NamedTuple):
         else:
             ctrl = last_point
 
-        end = last_point + self.end
+        end = Point(last_point.x + self.ex, last_point.y + self.ey)
 
         return QuadraticBezierCurve(ctrl, end).render(
             path_gsds, style, last_item, initial_point
         )
 
-    def render_debug(
-        self, path_gsds, style, last_item, initial_point, debug_stream, pfx
-    ):
-        # pylint: disable=unused-argument
-        rendered, resolved, initial_point = self.render(
-            path_gsds, style, last_item, initial_point
+
+def _convert_move(pdf_path, cmd, current_pos):
+    if cmd.relative:
+        end = cmd.end - current_pos
+        PaintedPath.move_relative(pdf_path, x=end.real, y=end.imag)
+    else:
+        PaintedPath.move_to(pdf_path, x=cmd.end.real, y=cmd.end.imag)
+
+
+def _convert_line(pdf_path, cmd, current_pos):
+    if cmd.horizontal:
+        if cmd.relative:
+            delta = cmd.end - current_pos
+            PaintedPath.horizontal_line_relative(pdf_path, dx=delta.real)
+        else:
+            PaintedPath.horizontal_line_to(pdf_path, x=cmd.end.real)
+    elif cmd.vertical:
+        if cmd.relative:
+            delta = cmd.end - current_pos
+            PaintedPath.vertical_line_relative(pdf_path, dy=delta.imag)
+        else:
+            PaintedPath.vertical_line_to(pdf_path, y=cmd.end.imag)
+    else:
+        if cmd.relative:
+            delta = cmd.end - current_pos
+            PaintedPath.line_relative(pdf_path, dx=delta.real, dy=delta.imag)
+        else:
+            PaintedPath.line_to(pdf_path, x=cmd.end.real, y=cmd.end.imag)
+
+
+def _convert_arc(pdf_path, cmd, current_pos):
+    if cmd.relative:
+        end = cmd.end - current_pos
+        PaintedPath.arc_relative(
+            pdf_path,
+            rx=cmd.radius.real,
+            ry=cmd.radius.imag,
+            rotation=cmd.rotation,
+            large_arc=cmd.arc,
+            positive_sweep=cmd.sweep,
+            dx=end.real,
+            dy=end.imag,
+        )
+    else:
+        PaintedPath.arc_to(
+            pdf_path,
+            rx=cmd.radius.real,
+            ry=cmd.radius.imag,
+            rotation=cmd.rotation,
+            large_arc=cmd.arc,
+            positive_sweep=cmd.sweep,
+            x=cmd.end.real,
+            y=cmd.end.imag,
         )
-        debug_stream.write(f"{self} resolved to {resolved}\n")
 
-        return rendered, resolved, initial_point
+
+def _convert_cubic_bezier(pdf_path, cmd, current_pos):
+    if cmd.smooth:
+        if cmd.relative:
+            control2 = cmd.control2 - current_pos
+            end = cmd.end - current_pos
+            SVGRelativeSmoothCubicCurve.from_path_points(
+                pdf_path,
+                c2x=control2.real,
+                c2y=control2.imag,
+                ex=end.real,
+                ey=end.imag,
+            )
+        else:
+            SVGSmoothCubicCurve.from_path_points(
+                pdf_path,
+                c2x=cmd.control2.real,
+                c2y=cmd.control2.imag,
+                ex=cmd.end.real,
+                ey=cmd.end.imag,
+            )
+    else:
+        if cmd.relative:
+            control1 = cmd.control1 - current_pos
+            control2 = cmd.control2 - current_pos
+            end = cmd.end - current_pos
+            PaintedPath.curve_relative(
+                pdf_path,
+                dx1=control1.real,
+                dy1=control1.imag,
+                dx2=control2.real,
+                dy2=control2.imag,
+                dx3=end.real,
+                dy3=end.imag,
+            )
+        else:
+            PaintedPath.curve_to(
+                pdf_path,
+                x1=cmd.control1.real,
+                y1=cmd.control1.imag,
+                x2=cmd.control2.real,
+                y2=cmd.control2.imag,
+                x3=cmd.end.real,
+                y3=cmd.end.imag,
+            )
+
+
+def _convert_quadratic_bezier(pdf_path, cmd, current_pos):
+    if cmd.smooth:
+        if cmd.relative:
+            end = cmd.end - current_pos
+            SVGRelativeSmoothQuadraticCurve.from_path_points(
+                pdf_path, ex=end.real, ey=end.imag
+            )
+        else:
+            SVGSmoothQuadraticCurve.from_path_points(
+                pdf_path, ex=cmd.end.real, ey=cmd.end.imag
+            )
+    else:
+        if cmd.relative:
+            control = cmd.control - current_pos
+            end = cmd.end - current_pos
+            PaintedPath.quadratic_curve_relative(
+                pdf_path,
+                dx1=control.real,
+                dy1=control.imag,
+                dx2=end.real,
+                dy2=end.imag,
+            )
+        else:
+            PaintedPath.quadratic_curve_to(
+                pdf_path,
+                x1=cmd.control.real,
+                y1=cmd.control.imag,
+                x2=cmd.end.real,
+                y2=cmd.end.imag,
+            )
+
+
+def _convert_close(pdf_path, cmd, current_pos):
+    # pylint: disable=unused-argument
+    PaintedPath.close(pdf_path)
+
+
+if parse_path is None:
+    _SVG_PATH_CONVERTERS = {}
+else:
+    # svg.path always yields instances of these exact classes, so a lookup on the
+    # command type is enough to find the matching conversion.
+    _SVG_PATH_CONVERTERS = {
+        Move: _convert_move,
+        Line: _convert_line,
+        Arc: _convert_arc,
+        CubicBezier: _convert_cubic_bezier,
+        QuadraticBezier: _convert_quadratic_bezier,
+        Close: _convert_close,
+    }
+
+
+# a command letter or a number
+_PATH_TOKEN = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]|" + _NUMBER.pattern)
+_PATH_SEPARATORS = re.compile(r"[\s,]+")
+
+_PATH_ARGUMENT_COUNTS = {
+    "M": 2,
+    "L": 2,
+    "H": 1,
+    "V": 1,
+    "C": 6,
+    "S": 4,
+    "Q": 4,
+    "T": 2,
+    "A": 7,
+    "Z": 0,
+}
+# relative commands take as many arguments as their absolute counterparts
+_PATH_ARGUMENT_COUNTS.update(
+    {command.lower(): count for command, count in _PATH_ARGUMENT_COUNTS.items()}
+)
+
+_PATH_COMMAND_CONVERTERS = {
+    "M": PaintedPath.move_to,
+    "m": PaintedPath.move_relative,
+    "L": PaintedPath.line_to,
+    "l": PaintedPath.line_relative,
+    "H": PaintedPath.horizontal_line_to,
+    "h": PaintedPath.horizontal_line_relative,
+    "V": PaintedPath.vertical_line_to,
+    "v": PaintedPath.vertical_line_relative,
+    "C": PaintedPath.curve_to,
+    "c": PaintedPath.curve_relative,
+    "S": SVGSmoothCubicCurve.from_path_points,
+    "s": SVGRelativeSmoothCubicCurve.from_path_points,
+    "Q": PaintedPath.quadratic_curve_to,
+    "q": PaintedPath.quadratic_curve_relative,
+    "T": SVGSmoothQuadraticCurve.from_path_points,
+    "t": SVGRelativeSmoothQuadraticCurve.from_path_points,
+    "A": PaintedPath.arc_to,
+    "a": PaintedPath.arc_relative,
+    "Z": PaintedPath.close,
+    "z": PaintedPath.close,
+}
+
+
+def _parse_arc_arguments(tokens, idx, args):
+    for position in range(7):
+        try:
+            token = tokens[idx]
+        except IndexError:
+            raise ValueError("missing arguments for SVG path arc command") from None
+
+        if position in (3, 4):
+            # the large-arc and sweep flags are single characters that do not need to
+            # be separated from what follows, e.g. "a5 5 0 013 4" has flags 0 and 1
+            if token[0] not in "01":
+                raise ValueError(f"invalid SVG path arc flag {token}")
+            args.append(1.0 if token[0] == "1" else 0.0)
+            if len(token) > 1:
+                tokens[idx] = token[1:]
+                continue
+        else:
+            args.append(float(token))
+
+        idx += 1
+
+    return idx
+
+
+def _parse_path_data(svg_path):
+    """
+    Split SVG path data into its commands and their arguments.
+
+    Returns a `(commands, args)` tuple, where `commands` holds one character per
+    path command and `args` is a flat `array.array` of all of their numeric arguments,
+    in order. Implicitly repeated commands are expanded into separate entries, and the
+    coordinates following a moveto are turned into linetos. Raises a ValueError if
+    the path data is malformed.
+    """
+    tokens = _PATH_TOKEN.findall(svg_path)
+    # findall silently skips over anything that is not a token, so make sure that the
+    # tokens account for everything but the separators
+    if sum(map(len, tokens)) != len(_PATH_SEPARATORS.sub("", svg_path)):
+        raise ValueError(f"unexpected characters in SVG path {svg_path}")
+
+    commands = []
+    args = array("d")
+    command = None
+    idx = 0
+    count = len(tokens)
+    while idx < count:
+        token = tokens[idx]
+        if token in _PATH_ARGUMENT_COUNTS:
+            command = token
+            idx += 1
+            if command in "Zz":
+                commands.append(command)
+                continue
+        elif command is None or command in "Zz":
+            raise ValueError(f"SVG path argument {token} does not follow a command")
+
+        if command in "Aa":
+            idx = _parse_arc_arguments(tokens, idx, args)
+        else:
+            end = idx + _PATH_ARGUMENT_COUNTS[command]
+            if end > count:
+                raise ValueError(f"missing arguments for SVG path command {command}")
+            args.extend(map(float, tokens[idx:end]))
+            idx = end
+
+        commands.append(command)
+
+        if command == "M":
+            command = "L"
+        elif command == "m":
+            command = "l"
+
+    return commands, args
+
+
+def _svg_path_lib_converter(pdf_path, svg_path):
+    current_pos = 0
+    for cmd in parse_path(svg_path):
+        try:
+            converter = _SVG_PATH_CONVERTERS[type(cmd)]
+        except KeyError:
+            raise NotImplementedError(
+                f"Unsupported svg.path command type: {cmd}"
+            ) from None
+        converter(pdf_path, cmd, current_pos)
+        current_pos = cmd.end
 
 
 @force_nodocument
 def svg_path_converter(pdf_path, svg_path):
     """Convert an SVG path string into a structured PDF path object"""
-    if parse_path is None:
-        raise EnvironmentError(
-            "svg?path not available - fpdf2 cannot insert SVG images"
-        )
-
     svg_path = svg_path.strip()
-    if svg_path[0] not in {"M", "m"}:
+    if not svg_path:
+        # empty path data disables the rendering of the path
+        return
+    if svg_path[0] not in ("M", "m"):
         raise ValueError(f"SVG path does not start with moveto command: {svg_path}")
 
-    current_pos = 0
-    for cmd in parse_path(svg_path):
-        if isinstance(cmd, Move):
-            if cmd.relative:
-                end = cmd.end - current_pos
-                PaintedPath.move_relative(pdf_path, x=end.real, y=end.imag)
-            else:
-                PaintedPath.move_to(pdf_path, x=cmd.end.real, y=cmd.end.imag)
-        elif isinstance(cmd, Line):
-            if cmd.horizontal:
-                if cmd.relative:
-                    delta = cmd.end - current_pos
-                    PaintedPath.horizontal_line_relative(pdf_path, dx=delta.real)
-                else:
-                    PaintedPath.horizontal_line_to(pdf_path, x=cmd.end.real)
-            elif cmd.vertical:
-                if cmd.relative:
-                    delta = cmd.end - current_pos
-                    PaintedPath.vertical_line_relative(pdf_path, dy=delta.imag)
-                else:
-                    PaintedPath.vertical_line_to(pdf_path, y=cmd.end.imag)
-            else:
-                if cmd.relative:
-                    delta = cmd.end - current_pos
-                    PaintedPath.line_relative(pdf_path, dx=delta.real, dy=delta.imag)
-                else:
-                    PaintedPath.line_to(pdf_path, x=cmd.end.real, y=cmd.end.imag)
-        elif isinstance(cmd, Arc):
-            if cmd.relative:
-                end = cmd.end - current_pos
-                PaintedPath.arc_relative(
-                    pdf_path,
-                    rx=cmd.radius.real,
-                    ry=cmd.radius.imag,
-                    rotation=cmd.rotation,
-                    large_arc=cmd.arc,
-                    positive_sweep=cmd.sweep,
-                    dx=end.real,
-                    dy=end.imag,
-                )
-            else:
-                PaintedPath.arc_to(
-                    pdf_path,
-                    rx=cmd.radius.real,
-                    ry=cmd.radius.imag,
-                    rotation=cmd.rotation,
-                    large_arc=cmd.arc,
-                    positive_sweep=cmd.sweep,
-                    x=cmd.end.real,
-                    y=cmd.end.imag,
-                )
-        elif isinstance(cmd, CubicBezier):
-            if cmd.smooth:
-                if cmd.relative:
-                    control2 = cmd.control2 - current_pos
-                    end = cmd.end - current_pos
-                    SVGRelativeSmoothCubicCurve.from_path_points(
-                        pdf_path,
-                        c2x=control2.real,
-                        c2y=control2.imag,
-                        ex=end.real,
-                        ey=end.imag,
-                    )
-                else:
-                    SVGSmoothCubicCurve.from_path_points(
-                        pdf_path,
-                        c2x=cmd.control2.real,
-                        c2y=cmd.control2.imag,
-                        ex=cmd.end.real,
-                        ey=cmd.end.imag,
-                    )
-            else:
-                if cmd.relative:
-                    control1 = cmd.control1 - current_pos
-                    control2 = cmd.control2 - current_pos
-                    end = cmd.end - current_pos
-                    PaintedPath.curve_relative(
-                        pdf_path,
-                        dx1=control1.real,
-                        dy1=control1.imag,
-                        dx2=control2.real,
-                        dy2=control2.imag,
-                        dx3=end.real,
-                        dy3=end.imag,
-                    )
-                else:
-                    PaintedPath.curve_to(
-                        pdf_path,
-                        x1=cmd.control1.real,
-                        y1=cmd.control1.imag,
-                        x2=cmd.control2.real,
-                        y2=cmd.control2.imag,
-                        x3=cmd.end.real,
-                        y3=cmd.end.imag,
-                    )
-        elif isinstance(cmd, QuadraticBezier):
-            if cmd.smooth:
-                if cmd.relative:
-                    end = cmd.end - current_pos
-                    SVGRelativeSmoothQuadraticCurve.from_path_points(
-                        pdf_path, ex=end.real, ey=end.imag
-                    )
-                else:
-                    SVGSmoothQuadraticCurve.from_path_points(
-                        pdf_path, ex=cmd.end.real, ey=cmd.end.imag
-                    )
-            else:
-                if cmd.relative:
-                    control = cmd.control - current_pos
-                    end = cmd.end - current_pos
-                    PaintedPath.quadratic_curve_relative(
-                        pdf_path,
-                        dx1=control.real,
-                        dy1=control.imag,
-                        dx2=end.real,
-                        dy2=end.imag,
-                    )
-                else:
-                    PaintedPath.quadratic_curve_to(
-                        pdf_path,
-                        x1=cmd.control.real,
-                        y1=cmd.control.imag,
-                        x2=cmd.end.real,
-                        y2=cmd.end.imag,
-                    )
-        elif isinstance(cmd, Close):
-            PaintedPath.close(pdf_path)
-        else:
-            raise NotImplementedError(f"Unsupported svg.path command type: {cmd}")
-        current_pos = cmd.end
+    try:
+        commands, args = _parse_path_data(svg_path)
+    except ValueError:
+        if parse_path is None:
+            # without svg.path, malformed path data fails the same way
+            raise
+        # svg.path is more lenient with malformed path data, e.g. it ignores any
+        # trailing garbage, so let it have a go at it.
+        _svg_path_lib_converter(pdf_path, svg_path)
+        return
+
+    offset = 0
+    for command in commands:
+        end = offset + _PATH_ARGUMENT_COUNTS[command]
+        _PATH_COMMAND_CONVERTERS[command](pdf_path, *args[offset:end])
+        offset = end
 
 
 class SVGObject:
@@ -882,7 +1225,7 @@ class SVGObject:
 
         svg_tree = parse_xml_str(svg_text)
 
-        if svg_tree.tag not in xmlns_lookup("svg", "svg"):
+        if svg_tree.tag not in _SVG_ROOT_TAGS:
             raise ValueError(f"root tag must be svg, not {svg_tree.tag}")
 
         self.extract_shape_info(svg_tree)
@@ -922,7 +1265,7 @@ class SVGObject:
             self.viewbox = None
         else:
             viewbox.strip()
-            vx, vy, vw, vh = [float(num) for num in NUMBER_SPLIT.split(viewbox)]
+            vx, vy, vw, vh = map(float, _split_numbers(viewbox))
             if (vw < 0) or (vh < 0):
                 raise ValueError(f"invalid negative width/height in viewbox {viewbox}")
 
@@ -991,32 +1334,26 @@ class SVGObject:
             converted from the SVG, scaled to the given viewport size.
         """
 
-        if ignore_svg_top_attrs:
-            vp_width = width
-        elif isinstance(self.width, Percent):
-            if not width:
-                raise ValueError(
-                    'SVG "width" is a percentage, hence a viewport width is required'
-                )
-            vp_width = self.width * width / 100
-        else:
-            vp_width = self.width or width
-
-        if ignore_svg_top_attrs:
-            vp_height = height
-        elif isinstance(self.height, Percent):
-            if not height:
-                raise ValueError(
-                    'SVG "height" is a percentage, hence a viewport height is required'
-                )
-            vp_height = self.height * height / 100
-        else:
-            vp_height = self.height or height
+        vp_width = width
+        vp_height = height
+        if not ignore_svg_top_attrs:
+            if isinstance(self.width, Percent):
+                if not width:
+                    raise ValueError(
+                        'SVG "width" is a percentage, hence a viewport width is required'
+                    )
+                vp_width = self.width * width / 100
+            elif self.width:
+                vp_width = self.width
 
-        if scale == 1:
-            transform = Transform.identity()
-        else:
-            transform = Transform.scaling(1 / scale)
+            if isinstance(self.height, Percent):
+                if not height:
+                    raise ValueError(
+                        'SVG "height" is a percentage, hence a viewport height is required'
+                    )
+                vp_height = self.height * height / 100
+            elif self.height:
+                vp_height = self.height
 
         if self.viewbox:
             vx, vy, vw, vh = self.viewbox
@@ -1030,17 +1367,27 @@ class SVGObject:
             if not ignore_svg_top_attrs and self.preserve_ar and (w_ratio != h_ratio):
                 w_ratio = h_ratio = min(w_ratio, h_ratio)
 
-            transform = (
-                transform
-                @ Transform.translation(x=-vx, y=-vy)
-                @ Transform.scaling(x=w_ratio, y=h_ratio)
-            )
-
             if align_viewbox:
-                transform = transform @ Transform.translation(
-                    x=vp_width / 2 - (vw / 2) * w_ratio,
-                    y=vp_height / 2 - (vh / 2) * h_ratio,
-                )
+                tx = vp_width / 2 - (vw / 2) * w_ratio
+                ty = vp_height / 2 - (vh / 2) * h_ratio
+            else:
+                tx = ty = 0
+
+            # this is scaling(1 / scale) @ translation(-vx, -vy)
+            # @ scaling(w_ratio, h_ratio) @ translation(tx, ty), computed directly
+            inv_scale = 1 / scale
+            transform = Transform(
+                a=inv_scale * w_ratio,
+                b=0,
+                c=0,
+                d=inv_scale * h_ratio,
+                e=tx - vx * w_ratio,
+                f=ty - vy * h_ratio,
+            )
+        elif scale == 1:
+            transform = _IDENTITY
+        else:
+            transform = Transform.scaling(1 / scale)
 
         self.base_group.transform = transform
 
@@ -1065,7 +1412,7 @@ class SVGObject:
         try:
             if x is not None and y is not None:
                 pdf.set_xy(0, 0)
-                path.transform = path.transform @ Transform.translation(x, y)
+                path.transform = path.transform.translate(x, y)
 
             pdf.draw_path(path, debug_stream)
 
@@ -1078,9 +1425,11 @@ class SVGObject:
     def handle_defs(self, defs):
         """Produce lookups for groups and paths inside the <defs> tag"""
         for child in defs:
-            if child.tag in xmlns_lookup("svg", "g"):
+            tag = child.tag
+            if tag in _SVG_G_TAGS:
                 self.build_group(child)
-            if child.tag in xmlns_lookup("svg", "path"):
+            # a path inside <defs> can only be drawn through a reference to its id
+            elif tag in _SVG_PATH_TAGS and "id" in child.attrib:
                 self.build_path(child)
 
     # this assumes xrefs only reference already-defined ids.
@@ -1091,12 +1440,11 @@ class SVGObject:
         pdf_group = GraphicsContext()
         apply_styles(pdf_group, xref)
 
-        for candidate in xmlns_lookup("xlink", "href"):
-            try:
-                ref = xref.attrib[candidate]
+        attrib = xref.attrib
+        for candidate in _XLINK_HREF_KEYS:
+            ref = attrib.get(candidate)
+            if ref is not None:
                 break
-            except KeyError:
-                pass
         else:
             raise ValueError(f"use {xref} doesn't contain known xref attribute")
 
@@ -1107,11 +1455,16 @@ class SVGObject:
                 f"use {xref} references nonexistent ref id {ref}"
             ) from None
 
-        if "x" in xref.attrib or "y" in xref.attrib:
-            # Quoting the SVG spec - 5.6.2. Layout of re-used graphics:
-            # > The x and y properties define an additional transformation translate(x,y)
-            x, y = float(xref.attrib.get("x", 0)), float(xref.attrib.get("y", 0))
-            pdf_group.transform = Transform.translation(x=x, y=y)
+        # Quoting the SVG spec - 5.6.2. Layout of re-used graphics:
+        # > The x and y properties define an additional transformation translate(x,y)
+        x, y = float(attrib.get("x", 0)), float(attrib.get("y", 0))
+        if x or y:
+            translation = Transform.translation(x=x, y=y)
+            if pdf_group.transform is not None:
+                # the translation is appended to the element's own transform list, so
+                # it applies first
+                translation = translation @ pdf_group.transform
+            pdf_group.transform = translation
         # Note that we currently do not support "width" & "height" in <use>
 
         return pdf_group
@@ -1123,39 +1476,78 @@ class SVGObject:
             pdf_group = GraphicsContext()
             apply_styles(pdf_group, group)
 
-        for child in group:
-            if child.tag in xmlns_lookup("svg", "defs"):
-                self.handle_defs(child)
-            if child.tag in xmlns_lookup("svg", "g"):
-                pdf_group.add_item(self.build_group(child))
-            if child.tag in xmlns_lookup("svg", "path"):
-                pdf_group.add_item(self.build_path(child))
-            elif child.tag in shape_tags:
-                pdf_group.add_item(getattr(ShapeBuilder, shape_tags[child.tag])(child))
-            if child.tag in xmlns_lookup("svg", "use"):
-                pdf_group.add_item(self.build_xref(child))
-
-        try:
-            self.cross_references["#" + group.attrib["id"]] = pdf_group
-        except KeyError:
-            pass
+        # Nested groups are walked with an explicit stack rather than recursively, so
+        # that deeply nested documents can't exceed the interpreter recursion limit.
+        # Each entry holds a <g> element, its PDF group, an iterator over its remaining
+        # children and the PDF group of its parent.
+        cross_references = self.cross_references
+        stack = [(group, pdf_group, iter(group), None)]
+        while stack:
+            element, current_group, children, parent_group = stack[-1]
+            for child in children:
+                tag = child.tag
+                builder = _GROUP_CHILD_BUILDERS.get(tag)
+                if builder is None:
+                    continue
+
+                if builder is not _NESTED_GROUP:
+                    item = getattr(self, builder)(child)
+                    # <defs> only register cross-references, they are not drawn. Like
+                    # nested groups, the other items are freshly converted and don't
+                    # need to be copied.
+                    if item is not None:
+                        current_group.add_item(item, _copy=False)
+                # an empty group draws nothing, only build it if it can be referenced
+                elif len(child) or "id" in child.attrib:
+                    child_group = GraphicsContext()
+                    apply_styles(child_group, child)
+                    stack.append((child, child_group, iter(child), current_group))
+                    break
+            else:
+                # all children have been converted, the group is now complete
+                stack.pop()
+                attrib = element.attrib
+                element_id = attrib.get("id")
+                if element_id is not None:
+                    # registered right away, later <use> siblings may reference it
+                    cross_references["#" + element_id] = current_group
+
+                if parent_group is None:
+                    continue
+
+                # The group was just built for this parent, a <use> referencing it
+                # makes its own copy, so there is no need to copy it here.
+                items = current_group.path_items
+                if len(items) == 1 and _STYLE_KEYS.isdisjoint(attrib):
+                    # without styles of its own, the group would only wrap its single
+                    # item in an extra graphics state save/restore
+                    parent_group.add_item(items[0], _copy=False)
+                elif items:
+                    # groups without drawable children (e.g. only <title> or <desc>)
+                    # are left out
+                    parent_group.add_item(current_group, _copy=False)
 
         return pdf_group
 
+    @force_nodocument
+    def build_shape(self, shape):
+        """Convert an SVG basic shape tag (<rect>, <circle>...) into a PDF path object."""
+        return getattr(ShapeBuilder, shape_tags[shape.tag])(shape)
+
     @force_nodocument
     def build_path(self, path):
         """Convert an SVG <path> tag into a PDF path object."""
         pdf_path = PaintedPath()
         apply_styles(pdf_path, path)
 
-        svg_path = path.attrib.get("d", None)
+        attrib = path.attrib
+        svg_path = attrib.get("d")
 
         if svg_path is not None:
             svg_path_converter(pdf_path, svg_path)
 
-        try:
-            self.cross_references["#" + path.attrib["id"]] = pdf_path
-        except KeyError:
-            pass
+        path_id = attrib.get("id")
+        if path_id is not None:
+            self.cross_references["#" + path_id] = pdf_path
 
         return pdf_path
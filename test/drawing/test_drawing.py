@@ -324,6 +324,13 @@ class TestTransform:
             )
         )
 
+    def test_translate_scale_shortcuts(self):
+        tf = fpdf.drawing.Transform(1, 2, 3, 4, 5, 6)
+
+        assert tf.translate(7, 8) == tf @ fpdf.drawing.Transform.translation(7, 8)
+        assert tf.scale(7, 8) == tf @ fpdf.drawing.Transform.scaling(7, 8)
+        assert tf.scale(7) == tf @ fpdf.drawing.Transform.scaling(7)
+
     def test_about(self):
         tf = fpdf.drawing.Transform.scaling(2).about(10, 10)
 
@@ -74,10 +74,10 @@ C = pointifier(BezierCurve)
 c = pointifier(RelativeBezierCurve)
 Q = pointifier(QuadraticBezierCurve)
 q = pointifier(RelativeQuadraticBezierCurve)
-S = pointifier(SVGSmoothCubicCurve)
-s = pointifier(SVGRelativeSmoothCubicCurve)
-T = pointifier(SVGSmoothQuadraticCurve)
-t = pointifier(SVGRelativeSmoothQuadraticCurve)
+S = SVGSmoothCubicCurve
+s = SVGRelativeSmoothCubicCurve
+T = SVGSmoothQuadraticCurve
+t = SVGRelativeSmoothQuadraticCurve
 iz = pointifier(ImplicitClose)
 Z = pointifier(Close)
 
@@ -291,6 +291,18 @@ test_svg_shape_tags = (
         pytest.raises(KeyError),
         id="polyline no points",
     ),
+    pytest.param(
+        '<polyline points="1, 0 10, 10, -20"/>',
+        [M(1, 0), L(10, 10)],
+        no_error(),
+        id="polyline odd points",
+    ),
+    pytest.param(
+        '<polyline points="0,0 10-10 20.5.5"/>',
+        [M(0, 0), L(10, -10), L(20.5, 0.5)],
+        no_error(),
+        id="polyline compact points",
+    ),
     pytest.param(
         '<polygon points="1, 0 10, 10, -20, -50"/>',
         [M(1, 0), L(10, 10), L(-20, -50), Z()],
@@ -303,9 +315,17 @@ test_svg_shape_tags = (
         pytest.raises(KeyError),
         id="polygon no points",
     ),
+    pytest.param(
+        '<polygon points=""/>',
+        [],
+        no_error(),
+        id="polygon empty points",
+    ),
 )
 
 test_svg_transforms = (
+    pytest.param("", Transform.identity(), no_error(), id="empty"),
+    pytest.param("none", Transform.identity(), no_error(), id="none"),
     pytest.param(
         "matrix(1,2,3,4,5,6)",
         Transform(1, 2, 3, 4, 5, 6),
@@ -348,6 +368,12 @@ test_svg_transforms = (
         no_error(),
         id="scale y",
     ),
+    pytest.param(
+        "scale( 1, 2 )",
+        Transform.scaling(x=1, y=2),
+        no_error(),
+        id="scale padded arguments",
+    ),
     pytest.param(
         "scale(1 2 3)",
         Transform.identity(),
@@ -738,6 +764,33 @@ test_svg_attribute_conversion = (
     ),
 )
 
+test_svg_style_parsing = (
+    pytest.param(
+        '<path style="fill: black; stroke-width:2;"/>',
+        Gs(fill_color="#000", stroke_width=2),
+        no_error(),
+        id="style attribute",
+    ),
+    pytest.param(
+        '<path style=";fill:;stroke-width;:2;"/>',
+        Gs(),
+        no_error(),
+        id="style attribute malformed declarations",
+    ),
+    pytest.param(
+        '<path style="fill:url(#a:b)"/>',
+        Gs(),
+        pytest.raises(ValueError),
+        id="style attribute value containing a colon",
+    ),
+    pytest.param(
+        '<path d="M 0 0"/>',
+        Gs(),
+        no_error(),
+        id="no styling attributes",
+    ),
+)
+
 test_svg_sources = (
     pytest.param(svgfile("arcs01.svg"), id="SVG spec arcs01"),
     pytest.param(svgfile("arcs02.svg"), id="SVG spec arcs02"),
@@ -764,6 +817,8 @@ test_svg_sources = (
 )
 
 svg_path_edge_cases = (
+    pytest.param("", [], id="empty path data"),
+    pytest.param("  ", [], id="blank path data"),
     pytest.param(
         "M0 1L2 3z", [M(0, 1), L(2, 3), Z()], id="no whitespace around commands"
     ),
@@ -784,6 +839,22 @@ svg_path_edge_cases = (
         id="floating point numbers",
     ),
     pytest.param("M0..1L.2.3.4.5", [M(0.0, 0.1), L(0.2, 0.3), L(0.4, 0.5)], id="why"),
+    pytest.param(
+        "M0 0 1e1 2E-1", [M(0, 0), L(10, 0.2)], id="implicit L exponentiated numbers"
+    ),
+    pytest.param(
+        "M 0 1 a 2 3 0 111 2",
+        [M(0, 1), a(P(2, 3), 0, True, True, P(1, 2))],
+        id="arc with joined flags and coordinates",
+    ),
+    pytest.param(
+        "M 0 1 z m 2 3 l 4 5",
+        [M(0, 1), Z(), m(0, 0), m(2, 3), l(4, 5)],
+        id="relative move after close",
+    ),
+    pytest.param(
+        "M 0 1 L 2 3 4", [M(0, 1), L(2, 3)], id="trailing garbage (svg.path fallback)"
+    ),
 )
 
 svg_path_directives = (
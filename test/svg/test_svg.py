@@ -50,6 +50,27 @@ class TestUnits:
         value = 1.5
         assert fpdf.svg.resolve_length(f"{value}") == value
 
+    def test_resolve_implicit_length_units_default(self):
+        assert fpdf.svg.resolve_length("2", default_unit="in") == 144
+        assert fpdf.svg.resolve_length(" 2 ", default_unit="px") == 1.5
+
+    def test_resolve_exponent_length_units(self):
+        assert fpdf.svg.resolve_length("1e1in") == 720
+        with pytest.raises(ValueError):
+            fpdf.svg.resolve_length("1e1em")
+
+    @pytest.mark.parametrize(
+        "value", ("nan", "inf", "-Infinity", "infpx", "1e999", "1_0", "1_0px", "")
+    )
+    def test_resolve_invalid_length_numbers(self, value):
+        with pytest.raises(ValueError):
+            fpdf.svg.resolve_length(value)
+
+    @pytest.mark.parametrize("value", ("nan", "inf", "infdeg", "1_0", "1_0rad", ""))
+    def test_resolve_invalid_angle_numbers(self, value):
+        with pytest.raises(ValueError):
+            fpdf.svg.resolve_angle(value)
+
     def test_resolve_angle_bad_units(self):
         with pytest.raises(ValueError):
             fpdf.svg.resolve_angle("1 fake")
@@ -62,6 +83,18 @@ class TestUnits:
         assert isinstance(computed, float)
 
 
+def test_clear_svg_caches():
+    fpdf.svg.resolve_length("1mm")
+    fpdf.svg.svgcolor("black")
+    assert fpdf.svg.svgcolor.cache_info().currsize > 0
+    fpdf.svg.clear_svg_caches()
+    assert fpdf.svg.resolve_length.cache_info().currsize == 0
+    assert fpdf.svg.resolve_angle.cache_info().currsize == 0
+    assert fpdf.svg.svgcolor.cache_info().currsize == 0
+    assert fpdf.svg.convert_style_attrs.cache_info().currsize == 0
+    assert fpdf.svg.convert_transforms.cache_info().currsize == 0
+
+
 def test_xmlns_lookup_failure():
     result = fpdf.svg.xmlns("this is not a real xml namespace", "rect")
     assert result == "rect"
@@ -104,6 +137,19 @@ class TestSVGPathParsing:
         with pytest.raises(ValueError):
             fpdf.svg.svg_path_converter(pdf_path, "L 1 2")
 
+    def test_bad_path_data(self):
+        pdf_path = fpdf.drawing.PaintedPath()
+
+        with pytest.raises(ValueError):
+            fpdf.svg.svg_path_converter(pdf_path, "M 0 0 L 1")
+
+    def test_bad_path_data_without_svg_path(self, monkeypatch):
+        monkeypatch.setattr(fpdf.svg, "parse_path", None)
+        pdf_path = fpdf.drawing.PaintedPath()
+
+        with pytest.raises(ValueError):
+            fpdf.svg.svg_path_converter(pdf_path, "M 0 1 L 2 3 4")
+
     @pytest.mark.parametrize(
         "debug", (pytest.param(False, id="no debug"), pytest.param(True, id="debug"))
     )
@@ -172,6 +218,28 @@ class TestSVGAttributeConversion:
             fpdf.svg.apply_styles(stylable, xml)
             assert_style_match(stylable.style, expected)
 
+    @pytest.mark.parametrize(
+        "element, expected, guard", parameters.test_svg_style_parsing
+    )
+    def test_style_attribute_parsing(self, element, expected, guard):
+        xml = parse_xml_str(element)
+
+        stylable = fpdf.drawing.PaintedPath()
+        with guard:
+            fpdf.svg.apply_styles(stylable, xml)
+            assert_style_match(stylable.style, expected)
+
+    def test_unstyled_element_skips_style_parsing(self, monkeypatch):
+        def parse_style(svg_element):
+            raise AssertionError("parse_style called on an unstyled element")
+
+        monkeypatch.setattr(fpdf.svg, "parse_style", parse_style)
+        xml = parse_xml_str('<path d="M 0 0"/>')
+
+        stylable = fpdf.drawing.PaintedPath()
+        fpdf.svg.apply_styles(stylable, xml)
+        assert stylable.style.auto_close is False
+
 
 class TestSVGObject:
     def test_bad_root_tag(self):
@@ -229,6 +297,69 @@ class TestSVGObject:
         )
         fpdf.svg.SVGObject(svg_data)
 
+    def test_deeply_nested_groups(self):
+        depth = 5000
+        svg_data = (
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            + "<g>" * depth
+            + '<path id="path" d="M 0 0 L 1 2 Z"/>'
+            + "</g>" * depth
+            + "</svg>"
+        )
+        svg = fpdf.svg.SVGObject(svg_data)
+        assert "#path" in svg.cross_references
+
+    def test_empty_groups(self):
+        svg_data = (
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            "<g/><g><title>nothing to draw</title></g>"
+            '<g id="empty"/><path d="M 0 0 L 1 2 Z"/></svg>'
+        )
+        svg = fpdf.svg.SVGObject(svg_data)
+        assert "#empty" in svg.cross_references
+        assert len(svg.base_group.path_items) == 1
+
+    def test_single_child_groups(self):
+        svg_data = (
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            '<g><g><path d="M 0 0 L 1 2 Z"/></g></g>'
+            '<g fill="red"><path d="M 0 0 L 1 2 Z"/></g></svg>'
+        )
+        svg = fpdf.svg.SVGObject(svg_data)
+        plain, styled = svg.base_group.path_items
+        assert isinstance(plain, fpdf.drawing.PaintedPath)
+        assert isinstance(styled, fpdf.drawing.GraphicsContext)
+
+    @pytest.mark.parametrize(
+        "use_attrs, expected_tf",
+        (
+            pytest.param(
+                'transform="scale(2)" x="5"',
+                fpdf.drawing.Transform(2, 0, 0, 2, 10, 0),
+                id="transform and x",
+            ),
+            pytest.param(
+                'transform="scale(2)" x="0" y="0"',
+                fpdf.drawing.Transform.scaling(2),
+                id="transform and zero x/y",
+            ),
+            pytest.param(
+                'x="5" y="3"',
+                fpdf.drawing.Transform.translation(5, 3),
+                id="x/y only",
+            ),
+        ),
+    )
+    def test_xref_position(self, use_attrs, expected_tf):
+        svg_data = (
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            'xmlns:xlink="http://www.w3.org/1999/xlink">'
+            '<defs><path id="path" d="M 0 0 L 1 2 Z"/></defs>'
+            f'<use xlink:href="#path" {use_attrs}/></svg>'
+        )
+        svg = fpdf.svg.SVGObject(svg_data)
+        assert svg.base_group.path_items[-1].transform == pytest.approx(expected_tf)
+
     def test_bad_xref(self):
         svg_data = (
             '<svg xmlns="http://www.w3.org/2000/svg" '